@@ -4,6 +4,7 @@ Tools for processing Segments, or lists of Segments.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Iterable
 
 from rich.segment import Segment
@@ -145,6 +146,20 @@ def line_trim(segments: list[Segment], start: bool, end: bool) -> list[Segment]:
     return segments
 
 
+@lru_cache(maxsize=1024)
+def _pad_segment(cell_count: int, style: Style) -> Segment:
+    """Get a segment of blank cells, to be used as padding.
+
+    Args:
+        cell_count: Number of cells.
+        style: Style of the cells.
+
+    Returns:
+        A Segment of spaces.
+    """
+    return Segment(" " * cell_count, style)
+
+
 def line_pad(
     segments: Iterable[Segment], pad_left: int, pad_right: int, style: Style
 ) -> list[Segment]:
@@ -161,19 +176,19 @@ def line_pad(
     """
     if pad_left and pad_right:
         return [
-            Segment(" " * pad_left, style),
+            _pad_segment(pad_left, style),
             *segments,
-            Segment(" " * pad_right, style),
+            _pad_segment(pad_right, style),
         ]
     elif pad_left:
         return [
-            Segment(" " * pad_left, style),
+            _pad_segment(pad_left, style),
             *segments,
         ]
     elif pad_right:
         return [
             *segments,
-            Segment(" " * pad_right, style),
+            _pad_segment(pad_right, style),
         ]
     return list(segments)
 
@@ -214,7 +229,7 @@ def align_lines(
         Returns:
             A list of blank lines.
         """
-        return [[Segment(" " * width, style)]] * count
+        return [[_pad_segment(width, style)]] * count
 
     top_blank_lines = bottom_blank_lines = 0
     vertical_excess_space = max(0, height - shape_height)
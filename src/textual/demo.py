@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import webbrowser
+from functools import lru_cache
 from importlib.metadata import version
 from pathlib import Path
 from typing import cast
@@ -18,6 +20,7 @@ from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, ScrollableContainer
 from textual.reactive import reactive
+from textual.widget import Widget
 from textual.widgets import (
     Button,
     DataTable,
@@ -165,6 +168,44 @@ JSON_EXAMPLE = """{
 }
 """
 
+EXAMPLE_PRETTY = Pretty(DATA, indent_guides=True)
+
+QUICK_ACCESS = (
+    ("TOP", ".location-top"),
+    ("Widgets", ".location-widgets"),
+    ("Rich content", ".location-rich"),
+    ("CSS", ".location-css"),
+)
+
+DEMO_ROWS = [[f"Cell ([b]{n}[/b], {col})" for col in range(6)] for n in range(20)]
+
+
+@lru_cache(maxsize=None)
+def _md(markdown: str) -> Markdown:
+    """Get a Markdown renderable, parsed once per source string.
+
+    Args:
+        markdown: Markdown source.
+
+    Returns:
+        A Markdown renderable.
+    """
+    return Markdown(markdown)
+
+
+@lru_cache(maxsize=1)
+def _syntax(code: str, lexer: str) -> Syntax:
+    """Get a Syntax renderable, reused while the code and lexer are unchanged.
+
+    Args:
+        code: Source code to highlight.
+        lexer: Name of the lexer.
+
+    Returns:
+        A Syntax renderable.
+    """
+    return Syntax(code, lexer, theme="material", line_numbers=True)
+
 
 class Body(ScrollableContainer):
     pass
@@ -176,28 +217,44 @@ class Title(Static):
 
 class DarkSwitch(Horizontal):
     def compose(self) -> ComposeResult:
-        yield Switch(value=self.app.dark)
+        self._switch = Switch(value=self.app.dark)
+        yield self._switch
         yield Static("Dark mode toggle", classes="label")
 
     def on_mount(self) -> None:
         self.watch(self.app, "dark", self.on_dark_change, init=False)
 
-    def on_dark_change(self) -> None:
-        self.query_one(Switch).value = self.app.dark
+    def on_dark_change(self, dark: bool) -> None:
+        self._switch.value = dark
 
     def on_switch_changed(self, event: Switch.Changed) -> None:
         self.app.dark = event.value
 
 
 class Welcome(Container):
+    def __init__(
+        self,
+        *children: Widget,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+        disabled: bool = False,
+    ) -> None:
+        super().__init__(
+            *children, name=name, id=id, classes=classes, disabled=disabled
+        )
+        self._first_location: Widget | None = None
+
     def compose(self) -> ComposeResult:
-        yield Static(Markdown(WELCOME_MD))
+        yield Static(_md(WELCOME_MD))
         yield Button("Start", variant="success")
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         app = cast(DemoApp, self.app)
         app.add_note("[b magenta]Start!")
-        app.query_one(".location-first").scroll_visible(duration=0.5, top=True)
+        if self._first_location is None:
+            self._first_location = app.query_one(".location-first")
+        self._first_location.scroll_visible(duration=0.5, top=True)
 
 
 class OptionGroup(Container):
@@ -248,10 +305,13 @@ class LocationLink(Static):
     def __init__(self, label: str, reveal: str) -> None:
         super().__init__(label)
         self.reveal = reveal
+        self._target: Widget | None = None
 
     def on_click(self) -> None:
         app = cast(DemoApp, self.app)
-        app.query_one(self.reveal).scroll_visible(top=True, duration=0.5)
+        if self._target is None:
+            self._target = app.query_one(self.reveal)
+        self._target.scroll_visible(top=True, duration=0.5)
         app.add_note(f"Scrolling to [b]{self.reveal}[/b]")
 
 
@@ -286,27 +346,26 @@ class DemoApp(App[None]):
 
     show_sidebar = reactive(False)
 
+    _notes: RichLog  # Set in on_mount
+
     def add_note(self, renderable: RenderableType) -> None:
-        self.query_one(RichLog).write(renderable)
+        self._notes.write(renderable)
 
     def compose(self) -> ComposeResult:
         example_css = Path(self.css_path[0]).read_text()
         yield Container(
             Sidebar(classes="-hidden"),
             Header(show_clock=False),
-            RichLog(classes="-hidden", wrap=False, highlight=True, markup=True),
+            RichLog(classes="-hidden", wrap=False, highlight=False, markup=True),
             Body(
                 QuickAccess(
-                    LocationLink("TOP", ".location-top"),
-                    LocationLink("Widgets", ".location-widgets"),
-                    LocationLink("Rich content", ".location-rich"),
-                    LocationLink("CSS", ".location-css"),
+                    *[LocationLink(label, reveal) for label, reveal in QUICK_ACCESS]
                 ),
                 AboveFold(Welcome(), classes="location-top"),
                 Column(
                     Section(
                         SectionTitle("Widgets"),
-                        TextContent(Markdown(WIDGETS_MD)),
+                        TextContent(_md(WIDGETS_MD)),
                         LoginForm(),
                         DataTable(),
                     ),
@@ -315,9 +374,9 @@ class DemoApp(App[None]):
                 Column(
                     Section(
                         SectionTitle("Rich"),
-                        TextContent(Markdown(RICH_MD)),
+                        TextContent(_md(RICH_MD)),
                         SubTitle("Pretty Printed data (try resizing the terminal)"),
-                        Static(Pretty(DATA, indent_guides=True), classes="pretty pad"),
+                        Static(EXAMPLE_PRETTY, classes="pretty pad"),
                         SubTitle("JSON"),
                         Window(Static(JSON(JSON_EXAMPLE), expand=True), classes="pad"),
                         SubTitle("Tables"),
@@ -328,15 +387,10 @@ class DemoApp(App[None]):
                 Column(
                     Section(
                         SectionTitle("CSS"),
-                        TextContent(Markdown(CSS_MD)),
+                        TextContent(_md(CSS_MD)),
                         Window(
                             Static(
-                                Syntax(
-                                    example_css,
-                                    "css",
-                                    theme="material",
-                                    line_numbers=True,
-                                ),
+                                _syntax(example_css, "css"),
                                 expand=True,
                             )
                         ),
@@ -349,8 +403,6 @@ class DemoApp(App[None]):
 
     def action_open_link(self, link: str) -> None:
         self.app.bell()
-        import webbrowser
-
         webbrowser.open(link)
 
     def action_toggle_sidebar(self) -> None:
@@ -364,6 +416,7 @@ class DemoApp(App[None]):
             sidebar.add_class("-hidden")
 
     def on_mount(self) -> None:
+        self._notes = self.query_one(RichLog)
         self.add_note("Textual Demo app is running")
         table = self.query_one(DataTable)
         table.add_column("Foo", width=20)
@@ -373,8 +426,7 @@ class DemoApp(App[None]):
         table.add_column("Bar", width=20)
         table.add_column("Baz", width=20)
         table.zebra_stripes = True
-        for n in range(20):
-            table.add_row(*[f"Cell ([b]{n}[/b], {col})" for col in range(6)])
+        table.add_rows(DEMO_ROWS)
         self.query_one("Welcome Button", Button).focus()
 
     def action_screenshot(self, filename: str | None = None, path: str = "./") -> None:
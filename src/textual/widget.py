@@ -3302,16 +3302,16 @@ class Widget(DOMNode):
 
         styles = self.styles
         align_horizontal, align_vertical = styles.content_align
-        lines = list(
-            align_lines(
+        strips = [
+            Strip(line, width)
+            for line in align_lines(
                 lines,
                 _NULL_STYLE,
                 self.size,
                 align_horizontal,
                 align_vertical,
             )
-        )
-        strips = [Strip(line, width) for line in lines]
+        ]
         self._render_cache = _RenderCache(self.size, strips)
         self._dirty_regions.clear()
 